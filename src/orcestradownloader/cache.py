@@ -1,10 +1,70 @@
 import json
-from datetime import datetime
+import logging
+import os
+import pickle
+import tempfile
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from orcestradownloader import __version__
 from orcestradownloader.logging_config import logger as log
 
+try:
+	import orjson
+except ImportError:  # pragma: no cover
+	_HAS_ORJSON = False
+else:
+	_HAS_ORJSON = True
+
+
+def _stdlib_json_dumps(obj: Any) -> bytes:  # noqa: ANN401
+	"""Serialize ``obj`` to UTF-8 encoded JSON bytes."""
+	return json.dumps(obj).encode('utf-8')
+
+
+# orjson is an optional speedup; the stdlib json module is used without it
+json_loads: Callable[[bytes], Any] = orjson.loads if _HAS_ORJSON else json.loads
+json_dumps: Callable[[Any], bytes] = orjson.dumps if _HAS_ORJSON else _stdlib_json_dumps
+
+
+# Parsed cache payloads shared by every Cache instance in this process, keyed by
+# file path and validated against the file's (mtime_ns, size) signature.
+_PARSED: Dict[Path, Tuple[Tuple[int, int], datetime, List[dict], Dict[str, str]]] = {}
+
+# Response validators kept in the cache file, and the request header that
+# sends each one back to the server for a conditional GET.
+_VALIDATORS = (('etag', 'If-None-Match'), ('last_modified', 'If-Modified-Since'))
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+	"""Write ``data`` to ``path`` so readers never see a partial file.
+
+	Each writer gets its own temporary file, so concurrent writers never
+	move each other's half-written data into place.
+	"""
+	fd, name = tempfile.mkstemp(dir=path.parent, prefix=f'{path.name}.', suffix='.tmp')
+	tmp = Path(name)
+	try:
+		with os.fdopen(fd, 'wb') as f:
+			f.write(data)
+		tmp.replace(path)
+	except BaseException:
+		tmp.unlink(missing_ok=True)
+		raise
+
+
+_AGE_UNITS = ((86400, 'days'), (3600, 'hours'), (60, 'minutes'))
+
+
+def _humanize(diff: timedelta) -> str:
+	"""Describe the age of a cache entry, e.g. '3 hours ago'."""
+	seconds = int(diff.total_seconds())
+	for unit, label in _AGE_UNITS:
+		if count := seconds // unit:
+			return f'{count} {label} ago'
+	return '0 minutes ago'
+
 
 class Cache:
 	def __init__(
@@ -13,45 +73,186 @@ class Cache:
 		self.cache_dir = cache_dir
 		self.cache_file = cache_dir / cache_file
 		self.cache_days_to_keep = cache_days_to_keep
+		self.hydrated_file = self.cache_file.with_suffix('.pkl')
 
 	def get_cached_response(self, name: str) -> Optional[List[dict]]:
 		"""Retrieve cached response if it exists and is up-to-date."""
 		log.debug('Checking for cached response...')
-		if not self.cache_file.exists():
+		signature = self._signature()
+		if signature is None:
 			log.info('Cache file not found.')
 			return None
+		# The payload's date is never newer than the file's mtime, so an old file
+		# can be rejected with the stat alone, before reading and parsing it.
+		if self._age(datetime.fromtimestamp(signature[0] / 1e9)) is None:
+			log.info('Cache is outdated.')
+			return None
+		loaded = self._load()
+		if loaded is None:
+			return None
+		cache_date, response_data, _ = loaded
+
+		diff = self._age(cache_date)
+		if diff is None:
+			log.info('Cache is outdated.')
+			return None
+		self._log_hit(name, diff)
+		return response_data
+
+	def cache_response(
+		self,
+		name: str,
+		data: List[dict],
+		etag: Optional[str] = None,
+		last_modified: Optional[str] = None,
+	) -> None:
+		"""Save the response to the cache.
+
+		``etag`` and ``last_modified`` are the response's ``ETag`` and
+		``Last-Modified`` headers, used later to revalidate the cache.
+		"""
+		self.cache_dir.mkdir(parents=True, exist_ok=True)
+		now = datetime.now()
+		validators = {
+			key: value
+			for key, value in (('etag', etag), ('last_modified', last_modified))
+			if value
+		}
+		payload = {'date': now.isoformat(), 'data': data, **validators}
+		_write_atomic(self.cache_file, json_dumps(payload))
+		self.hydrated_file.unlink(missing_ok=True)
+		if (signature := self._signature()) is not None:
+			_PARSED[self.cache_file] = (signature, now, data, validators)
+		log.info('[bold magenta]%s:[/] Response cached successfully.', name)
+
+	def conditional_headers(self) -> Dict[str, str]:
+		"""Return request headers that revalidate the cached response.
+
+		These are built even if the cache has expired, so the server can
+		answer ``304 Not Modified`` instead of sending the data again.
+		"""
+		loaded = self._load()
+		if loaded is None:
+			return {}
+		validators = loaded[2]
+		return {
+			header: validators[key] for key, header in _VALIDATORS if key in validators
+		}
+
+	def refresh(self, name: str) -> Optional[List[dict]]:
+		"""Mark the cached response as current again and return it.
+
+		Used when the server reports that the cached response is not modified.
+		"""
+		loaded = self._load()
+		if loaded is None:
+			return None
+		_, data, validators = loaded
+		log.info('[bold magenta]%s:[/] Cached response is still current.', name)
+		self.cache_response(name, data, **validators)
+		return data
+
+	def _load(self) -> Optional[Tuple[datetime, List[dict], Dict[str, str]]]:
+		"""Read the cache file's date, data and validators, whatever its age."""
+		signature = self._signature()
+		if signature is None:
+			return None
+		memo = _PARSED.get(self.cache_file)
+		if memo is not None and memo[0] == signature:
+			return memo[1:]
 		try:
-			with self.cache_file.open('r') as f:
-				cached_data = json.load(f)
+			cached_data = json_loads(self.cache_file.read_bytes())
 			cache_date = datetime.fromisoformat(cached_data['date'])
-			if (datetime.now() - cache_date).days <= self.cache_days_to_keep:
-				diff = datetime.now() - cache_date
-				if diff.days > 0:
-					daysago = f'{diff.days} days ago'
-				else:
-					minutes = diff.seconds // 60
-					hours = minutes // 60
-					if hours > 0:
-						daysago = f'{hours} hours ago'
-					else:
-						daysago = f'{minutes} minutes ago'
-				log.info(
-					'[bold magenta]%s:[/] Using cached response from %s from file://%s',
-					name,
-					daysago,
-					self.cache_file,
-				)
-				response_data: List[dict] = cached_data['data']
-				return response_data
-			else:
-				log.info('Cache is outdated.')
+			response_data = cached_data['data']
 		except (json.JSONDecodeError, KeyError, ValueError) as e:
 			log.warning('Failed to load cache: %s', e)
-		return None
+			return None
+		validators = {
+			key: cached_data[key] for key, _ in _VALIDATORS if key in cached_data
+		}
+		_PARSED[self.cache_file] = (signature, cache_date, response_data, validators)
+		return cache_date, response_data, validators
 
-	def cache_response(self, name: str, data: List[dict]) -> None:
-		"""Save the response to the cache."""
-		self.cache_dir.mkdir(parents=True, exist_ok=True)
-		with self.cache_file.open('w') as f:
-			json.dump({'date': datetime.now().isoformat(), 'data': data}, f)
-		log.info('[bold magenta]%s:[/] Response cached successfully.', name)
+	def _age(self, cache_date: datetime) -> Optional[timedelta]:
+		"""Return the age of a cache entry, or None if it has expired."""
+		diff = datetime.now() - cache_date
+		if diff.days > self.cache_days_to_keep:
+			return None
+		return diff
+
+	def _log_hit(self, name: str, diff: timedelta) -> None:
+		if log.isEnabledFor(logging.INFO):
+			log.info(
+				'[bold magenta]%s:[/] Using cached response from %s from file://%s',
+				name,
+				_humanize(diff),
+				self.cache_file,
+			)
+
+	def _signature(self) -> Optional[Tuple[int, int]]:
+		"""Return the cache file's (mtime_ns, size), or None if it is missing."""
+		try:
+			stat = self.cache_file.stat()
+		except FileNotFoundError:
+			return None
+		return (stat.st_mtime_ns, stat.st_size)
+
+	def _hydrated_key(
+		self, dataset_type: type
+	) -> Optional[Tuple[int, int, str, str, Tuple[str, ...]]]:
+		"""Identify the cache file contents and the model that records were built from.
+
+		Besides the cache file's signature, the key records the package version
+		and the model's field layout, so pickles written by another release are
+		parsed again rather than unpickled into mismatched classes.
+		"""
+		signature = self._signature()
+		if signature is None:
+			return None
+		return (
+			*signature,
+			f'{dataset_type.__module__}.{dataset_type.__qualname__}',
+			__version__,
+			tuple(getattr(dataset_type, '__dataclass_fields__', ())),
+		)
+
+	def get_hydrated(self, dataset_type: type, name: str) -> Optional[List[Any]]:
+		"""Retrieve parsed records if they match the current, up-to-date cache file.
+
+		This avoids reading and parsing the JSON cache file altogether.
+		"""
+		key = self._hydrated_key(dataset_type)
+		if key is None:
+			return None
+		try:
+			with self.hydrated_file.open('rb') as f:
+				cached = pickle.load(f)
+			if cached['key'] != key:
+				return None
+			cache_date: datetime = cached['date']
+			records: List[Any] = cached['data']
+		except FileNotFoundError:
+			return None
+		except Exception as e:
+			log.debug('Failed to load hydrated cache: %s', e)
+			return None
+		diff = self._age(cache_date)
+		if diff is None:
+			return None
+		self._log_hit(name, diff)
+		return records
+
+	def put_hydrated(self, dataset_type: type, records: List[Any]) -> None:
+		"""Save parsed records alongside the cache file they were built from."""
+		key = self._hydrated_key(dataset_type)
+		memo = _PARSED.get(self.cache_file)
+		# The cache date is only known once the JSON file has been read or written
+		if key is None or memo is None or memo[0] != key[:2]:
+			return
+		_write_atomic(
+			self.hydrated_file,
+			pickle.dumps(
+				{'key': key, 'date': memo[1], 'data': records},
+				protocol=pickle.HIGHEST_PROTOCOL,
+			),
+		)
@@ -86,11 +86,11 @@ class DatasetMultiCommand(MultiCommand):
                 If a dataset name is provided, prints a table of the specified dataset.
                 """
                 manager = UnifiedDataManager(self.registry, force=force)
-                manager.fetch_one(name)
-                ds_manager = manager[name]
                 if ds_name:
-                    ds_manager[ds_name].print_summary(title=f"{ds_name} Summary")
+                    manager.fetch_one(name)
+                    manager[name][ds_name].print_summary(title=f"{ds_name} Summary")
                 else:
+                    # print_one_table fetches the data itself
                     manager.print_one_table(name)
 
             @ds_group.command(name="download")
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Dict, Type
 
 from orcestradownloader.models import (
@@ -11,6 +12,10 @@ from orcestradownloader.models import (
 	XevaSet,
 )
 
+CACHE_DIR = Path.home() / '.cache/orcestradownloader'
+
+CACHE_DAYS_TO_KEEP = 7
+
 
 @dataclass
 class DatasetConfig:
@@ -1,22 +1,43 @@
 import logging
 from logging import ERROR, getLevelName, getLogger
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
 import click
 from click.decorators import FC
-from rich.logging import RichHandler
+
+
+class _LazyRichHandler(logging.Handler):
+	"""Forward records to a RichHandler that is only created for the first one.
+
+	Importing rich is a large part of the package's import time, so it is put
+	off until something is actually logged.
+	"""
+
+	def __init__(self) -> None:
+		super().__init__()
+		self._handler: Optional[logging.Handler] = None
+
+	def emit(self, record: logging.LogRecord) -> None:
+		if self._handler is None:
+			from rich.logging import RichHandler  # noqa: PLC0415
+
+			self._handler = RichHandler(
+				rich_tracebacks=True, tracebacks_show_locals=True, markup=True
+			)
+			self._handler.setFormatter(logging.Formatter('%(message)s', datefmt='[%X]'))
+		self._handler.handle(record)
 
 
 def setup_logger(name: str) -> logging.Logger:
-	logging.basicConfig(
-		level=logging.INFO,
-		format='%(message)s',
-		datefmt='[%X]',
-		handlers=[
-			RichHandler(rich_tracebacks=True, tracebacks_show_locals=True, markup=True)
-		],
-	)
-	return logging.getLogger(name)
+	logger = logging.getLogger(name)
+	# Only attach the handler once, however many times this module is imported
+	if not logger.handlers:
+		logger.addHandler(_LazyRichHandler())
+		logger.setLevel(logging.INFO)
+		# The handler prints everything itself; passing records on to the root
+		# logger as well would print them twice once anything configures it
+		logger.propagate = False
+	return logger
 
 
 def set_log_verbosity(
@@ -1,15 +1,27 @@
 from __future__ import annotations
 
 import asyncio
+import operator
 import sys
 from collections import defaultdict
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Any, Callable, Dict, Generic, List, Optional, Type, TypeVar
+from http import HTTPStatus
+from typing import (
+	TYPE_CHECKING,
+	Any,
+	Callable,
+	Coroutine,
+	Dict,
+	Generic,
+	List,
+	Optional,
+	Type,
+	TypeVar,
+)
 
 import aiohttp
 from aiohttp import ClientTimeout
-from rich.console import Console
+from rich import get_console
 from rich.progress import (
 	BarColumn,
 	Progress,
@@ -18,30 +30,78 @@ from rich.progress import (
 )
 from rich.table import Table
 
-from orcestradownloader.cache import Cache
+from orcestradownloader.cache import Cache, json_loads
+from orcestradownloader.dataset_config import CACHE_DAYS_TO_KEEP, CACHE_DIR
 from orcestradownloader.logging_config import logger as log
 from orcestradownloader.models.base import BaseModel
 
+if TYPE_CHECKING:
+	from pathlib import Path
+
+try:
+	import uvloop
+except ImportError:  # pragma: no cover
+	_HAS_UVLOOP = False
+else:
+	_HAS_UVLOOP = sys.platform != 'win32'
+
 # Type variable for subclasses of BaseModel
 T = TypeVar('T', bound=BaseModel)
+R = TypeVar('R')
+
+_row_fields = operator.attrgetter(
+	'name', 'dataset.name', 'date_created_str', 'datatypes'
+)
+
+
+def _dataset_row(item: BaseModel) -> List[str]:
+	"""Build a table row for a dataset record."""
+	name, dataset_name, date_created, datatypes = _row_fields(item)
+	return [name, dataset_name, date_created, ', '.join(datatypes)]
 
-CACHE_DIR = Path.home() / '.cache/orcestradownloader'
 
+# Every API endpoint lives on orcestra.ca, so keep a small per-host pool with
+# cached DNS and bound each request so one slow endpoint can't stall fetch_all.
+API_TIMEOUT = ClientTimeout(total=30, connect=10)
 
-CACHE_DAYS_TO_KEEP = 7
+
+def _api_session() -> aiohttp.ClientSession:
+	"""Create a client session tuned for the orcestra.ca API."""
+	connector = aiohttp.TCPConnector(
+		limit=32, limit_per_host=8, ttl_dns_cache=600, keepalive_timeout=30
+	)
+	return aiohttp.ClientSession(connector=connector, timeout=API_TIMEOUT)
+
+
+def _run(coro: Coroutine[Any, Any, R]) -> R:
+	"""Run a coroutine to completion, on uvloop when it is available."""
+	if _HAS_UVLOOP:
+		result: R = uvloop.run(coro)
+		return result
+	return asyncio.run(coro)
+
+
+def _build_list(dataset_type: Type[T], items: List[dict]) -> List[T]:
+	"""Build dataset records from their JSON representation."""
+	records = dataset_type.from_json_many(items)
+	log.debug('Parsed %d %s records from JSON.', len(records), dataset_type.__name__)
+	return records
 
 
 class TablePrinter:
 	"""Handles table rendering for datasets using Rich."""
 
+	_COLORS = ('bold white', 'magenta', 'cyan', 'green', 'yellow', 'red', 'blue')
+
 	def __init__(self, title: str, headers: List[str]) -> None:
 		self.title = title
 		self.headers = headers
+		self.columns = list(zip(self.headers, self._COLORS, strict=False))
 
 	@property
 	def color_list(self) -> List[str]:
 		"""Simple list of colors for use in Rich."""
-		return ['bold white', 'magenta', 'cyan', 'green', 'yellow', 'red', 'blue']
+		return list(self._COLORS)
 
 	def print_table(self, items: List[Any], row_generator: Callable) -> None:
 		"""
@@ -54,17 +114,11 @@ class TablePrinter:
 		row_generator : callable
 				A function to generate rows from items.
 		"""
-		console = Console()
+		console = get_console()
 		table = Table(title=self.title)
 
-		for header in self.headers:
-			# table.add_column(header, justify="left", style="cyan", no_wrap=True)
-			table.add_column(
-				header,
-				justify='left',
-				style=self.color_list[self.headers.index(header)],
-				no_wrap=True,
-			)
+		for header, color in self.columns:
+			table.add_column(header, justify='left', style=color, no_wrap=True)
 
 		for item in items:
 			table.add_row(*row_generator(item))
@@ -80,30 +134,105 @@ class DatasetManager(Generic[T]):
 	cache_file: str
 	dataset_type: Type[T]
 	datasets: List[T] = field(default_factory=list)
+	_by_name: Dict[str, T] = field(default_factory=dict, init=False, repr=False)
+	_names: List[str] = field(default_factory=list, init=False, repr=False)
 
 	def __post_init__(self) -> None:
 		self.cache = Cache(CACHE_DIR, self.cache_file, CACHE_DAYS_TO_KEEP)
+		self._set_datasets(self.datasets)
+
+	def _set_datasets(self, datasets: List[T]) -> None:
+		"""Replace the datasets and rebuild the name index."""
+		self.datasets = datasets
+		self._by_name = {ds.name: ds for ds in datasets}
+		self._names = [ds.name for ds in datasets]
+
+	def load_cached(self, name: str) -> bool:
+		"""Load datasets from the local cache, returning False on a cache miss."""
+		if self.datasets:
+			return True
+		datasets = self.cache.get_hydrated(self.dataset_type, name=name)
+		if datasets is None:
+			cached_data = self.cache.get_cached_response(name=name)
+			if not cached_data:
+				return False
+			datasets = _build_list(self.dataset_type, cached_data)
+			self.cache.put_hydrated(self.dataset_type, datasets)
+		self._set_datasets(datasets)
+		return True
+
+	async def fetch_data(
+		self,
+		name: str,
+		force: bool = False,
+		session: Optional[aiohttp.ClientSession] = None,
+		skip_cache: bool = False,
+	) -> None:
+		"""Fetch datasets from API or cache.
 
-	async def fetch_data(self, name: str, force: bool = False) -> None:
-		"""Fetch datasets from API or cache."""
+		If ``session`` is given it is used for the request, letting callers
+		share one connection pool across several fetches. ``skip_cache`` goes
+		straight to the API for callers that already found the cache unusable;
+		unlike ``force``, an outdated cache is still revalidated.
+		"""
+		if not force and self.datasets:
+			return
 		log.info(
 			'[bold magenta]%s:[/] Fetching data from %s (force=%s)...',
 			name,
 			self.url,
 			force,
 		)
-		if not force and (cached_data := self.cache.get_cached_response(name=name)):
-			self.datasets = [self.dataset_type.from_json(item) for item in cached_data]
+		if not (force or skip_cache) and await asyncio.to_thread(
+			self.load_cached, name
+		):
 			return
 
-		async with aiohttp.ClientSession() as session:  # noqa: SIM117
-			async with session.get(self.url) as response:
-				data = await response.json()
-				log.info(
-					'[bold magenta]%s:[/] Fetched %d items from API.', name, len(data)
-				)
-				self.cache.cache_response(name, data)
-				self.datasets = [self.dataset_type.from_json(item) for item in data]
+		# A forced fetch must download the catalog again, so it is never revalidated
+		if session is None:
+			async with _api_session() as own_session:
+				await self._fetch_from_api(name, own_session, revalidate=not force)
+		else:
+			await self._fetch_from_api(name, session, revalidate=not force)
+
+	async def _fetch_from_api(
+		self, name: str, session: aiohttp.ClientSession, revalidate: bool = True
+	) -> None:
+		"""Fetch datasets from the API and refresh the cache.
+
+		With ``revalidate``, the cache file's validators are sent along, so an
+		unchanged catalog costs a ``304 Not Modified`` instead of a full download.
+		"""
+		headers = (
+			await asyncio.to_thread(self.cache.conditional_headers)
+			if revalidate
+			else {}
+		)
+		async with session.get(self.url, headers=headers) as response:
+			not_modified = bool(headers) and response.status == HTTPStatus.NOT_MODIFIED
+			body = b'' if not_modified else await response.read()
+			etag = response.headers.get('ETag')
+			last_modified = response.headers.get('Last-Modified')
+		if not_modified:
+			data = await asyncio.to_thread(self.cache.refresh, name)
+			if data is None:
+				# The cache file became unreadable after the validators were read,
+				# so download the catalog once more without them
+				await self._fetch_from_api(name, session, revalidate=False)
+				return
+		else:
+			data = json_loads(body)
+			log.info('[bold magenta]%s:[/] Fetched %d items from API.', name, len(data))
+			await asyncio.to_thread(
+				self.cache.cache_response,
+				name,
+				data,
+				etag=etag,
+				last_modified=last_modified,
+			)
+		datasets = await asyncio.to_thread(_build_list, self.dataset_type, data)
+		self._set_datasets(datasets)
+		await asyncio.to_thread(self.cache.put_hydrated, self.dataset_type, datasets)
 
 	def print(self, title: str, row_generator: Callable) -> None:
 		"""Print datasets in a formatted table."""
@@ -120,13 +249,13 @@ class DatasetManager(Generic[T]):
 
 	def names(self) -> List[str]:
 		"""List all datasets."""
-		return [ds.name for ds in self.datasets]
+		return self._names
 
 	def __getitem__(self, name: str) -> T:
 		"""Get a dataset by name."""
 		try:
-			return next(ds for ds in self.datasets if ds.name == name)
-		except StopIteration as se:
+			return self._by_name[name]
+		except KeyError as se:
 			msg = f'Dataset {name} not found in {self.__class__.__name__}.'
 			msg += f' Available datasets: {", ".join(self.names())}'
 			raise ValueError(msg) from se
@@ -163,14 +292,19 @@ class UnifiedDataManager:
 		self.registry = registry
 
 	def fetch_one(self, name: str) -> None:
-		asyncio.run(self.fetch_by_name(name, force=self.force))
+		_run(self.fetch_by_name(name, force=self.force))
 
 	def hydrate_cache(self) -> None:
 		"""Hydrate the cache."""
-		asyncio.run(self.fetch_all(force=True))
+		_run(self.fetch_all(force=True))
 
 	async def fetch_by_name(
-		self, name: str, force: bool = False, progress: Optional[Progress] = None
+		self,
+		name: str,
+		force: bool = False,
+		progress: Optional[Progress] = None,
+		session: Optional[aiohttp.ClientSession] = None,
+		skip_cache: bool = False,
 	) -> None:
 		"""Fetch a specific dataset by name."""
 		manager = self.registry.get_all_managers()[name]
@@ -179,19 +313,42 @@ class UnifiedDataManager:
 			if progress
 			else None
 		)
-		await manager.fetch_data(name=name, force=force)
+		await manager.fetch_data(
+			name=name, force=force, session=session, skip_cache=skip_cache
+		)
 		if progress and task is not None:
 			progress.update(task, completed=True)
 
 	async def fetch_all(self, force: bool = False) -> None:
 		"""Fetch all datasets asynchronously."""
-		with Progress(transient=True) as progress:
-			await asyncio.gather(
+		managers = self.registry.get_all_managers()
+		# Serve what we can from the cache first, off the event loop; the progress
+		# display and the HTTP session are only worth setting up if something has
+		# to be fetched.
+		if force:
+			pending = list(managers)
+		else:
+			cached = await asyncio.gather(
 				*[
-					self.fetch_by_name(name, force, progress)
-					for name in self.registry.get_all_managers()
+					asyncio.to_thread(manager.load_cached, name)
+					for name, manager in managers.items()
 				]
 			)
+			pending = [
+				name for name, hit in zip(managers, cached, strict=True) if not hit
+			]
+		if not pending:
+			return
+		async with _api_session() as session:
+			with Progress(transient=True) as progress:
+				await asyncio.gather(
+					*[
+						self.fetch_by_name(
+							name, force, progress, session, skip_cache=True
+						)
+						for name in pending
+					]
+				)
 
 	def print_one_table(self, name: str) -> None:
 		"""Print a single dataset."""
@@ -203,34 +360,16 @@ class UnifiedDataManager:
 			return
 
 		manager = self.registry.get_manager(name)
-		manager.print(
-			title=name.capitalize(),
-			row_generator=lambda item: [
-				item.name,
-				item.dataset.name,
-				item.date_created.strftime('%Y-%m-%d') if item.date_created else 'N/A',
-				', '.join(item.datatypes),
-			],
-		)
+		manager.print(title=name.capitalize(), row_generator=_dataset_row)
 
 	def print_all_table(self) -> None:
 		"""Print all datasets."""
 		# Fetch data asynchronously
-		asyncio.run(self.fetch_all(self.force))
+		_run(self.fetch_all(self.force))
 
 		# Print datasets
 		for name, manager in self.registry.get_all_managers().items():
-			manager.print(
-				title=name.capitalize(),
-				row_generator=lambda item: [
-					item.name,
-					item.dataset.name,
-					item.date_created.strftime('%Y-%m-%d')
-					if item.date_created
-					else 'N/A',
-					', '.join(item.datatypes),
-				],
-			)
+			manager.print(title=name.capitalize(), row_generator=_dataset_row)
 
 	def list_one(self, name: str, pretty: bool = True) -> None:
 		"""List a single dataset."""
@@ -245,9 +384,9 @@ class UnifiedDataManager:
 		ds_names = manager.names()
 
 		if pretty:
-			Console().print(f'[bold]{name}:[/]')
+			get_console().print(f'[bold]{name}:[/]')
 			for ds_name in ds_names:
-				Console().print(f'  - [green]{ds_name}[/]')
+				get_console().print(f'  - [green]{ds_name}[/]')
 		else:
 			import click
 
@@ -258,7 +397,7 @@ class UnifiedDataManager:
 		"""List all datasets."""
 		# Fetch data asynchronously
 		if force:
-			asyncio.run(self.fetch_all(self.force))
+			_run(self.fetch_all(self.force))
 
 		ds_dict = defaultdict(list)
 
@@ -268,9 +407,9 @@ class UnifiedDataManager:
 
 		if pretty:
 			for name, ds_names in ds_dict.items():
-				Console().print(f'[bold]{name}:[/]')
+				get_console().print(f'[bold]{name}:[/]')
 				for ds_name in ds_names:
-					Console().print(f'  - [green]{ds_name}[/]')
+					get_console().print(f'  - [green]{ds_name}[/]')
 		else:
 			for name, ds_names in ds_dict.items():
 				import click
@@ -306,7 +445,7 @@ class UnifiedDataManager:
 				raise ValueError(msg)
 			file_path = directory / manager_name / f'{ds.name}.RDS'
 			if file_path.exists() and not overwrite:
-				Console().print(
+				get_console().print(
 					f'[bold red]File {file_path} already exists. Use --overwrite to overwrite.[/]'
 				)
 				sys.exit(1)
@@ -314,20 +453,22 @@ class UnifiedDataManager:
 			file_paths[ds.name] = file_path
 
 		async def download_all(progress: Progress) -> List[Path]:
-			return await asyncio.gather(
-				*[
-					download_dataset(
-						ds.download_link,
-						file_paths[ds.name],
-						progress,
-						timeout_seconds=timeout_seconds,
-					)
-					for ds in dataset_list
-				]
-			)
+			async with aiohttp.ClientSession() as session:
+				return await asyncio.gather(
+					*[
+						download_dataset(
+							ds.download_link,
+							file_paths[ds.name],
+							progress,
+							timeout_seconds=timeout_seconds,
+							session=session,
+						)
+						for ds in dataset_list
+					]
+				)
 
 		with Progress() as progress:
-			return asyncio.run(download_all(progress))
+			return _run(download_all(progress))
 
 	def download_all(
 		self,
@@ -354,7 +495,7 @@ class UnifiedDataManager:
 				continue
 			file_path = directory / manager_name / f'{ds.name}.RDS'
 			if file_path.exists() and not overwrite:
-				Console().print(
+				get_console().print(
 					f'[bold red]File {file_path} already exists. Use --overwrite to overwrite.[/]'
 				)
 				sys.exit(1)
@@ -363,19 +504,21 @@ class UnifiedDataManager:
 			download_links.append(ds.download_link)
 
 		async def download_all_datasets(progress: Progress) -> List[Path]:
-			return await asyncio.gather(
-				*[
-					download_dataset(
-						download_link,
-						file_path,
-						progress,
-						timeout_seconds=timeout_seconds,
-					)
-					for download_link, file_path in zip(
-						download_links, file_paths, strict=True
-					)
-				]
-			)
+			async with aiohttp.ClientSession() as session:
+				return await asyncio.gather(
+					*[
+						download_dataset(
+							download_link,
+							file_path,
+							progress,
+							timeout_seconds=timeout_seconds,
+							session=session,
+						)
+						for download_link, file_path in zip(
+							download_links, file_paths, strict=True
+						)
+					]
+				)
 
 		with Progress(
 			'[progress.description]{task.description}',
@@ -387,7 +530,7 @@ class UnifiedDataManager:
 			TimeRemainingColumn(compact=True),
 			transient=True,
 		) as progress:
-			return asyncio.run(download_all_datasets(progress))
+			return _run(download_all_datasets(progress))
 
 	def names(self) -> List[str]:
 		"""List all managers."""
@@ -404,27 +547,37 @@ class UnifiedDataManager:
 
 
 async def download_dataset(
-	download_link: str, file_path: Path, progress: Progress, timeout_seconds: int = 3600
+	download_link: str,
+	file_path: Path,
+	progress: Progress,
+	timeout_seconds: int = 3600,
+	session: Optional[aiohttp.ClientSession] = None,
 ) -> Path:
 	"""Download a single dataset.
 
-	Called by the UnifiedDataManager.download_by_name method
+	Called by the UnifiedDataManager.download_by_name method. Pass ``session``
+	to reuse one connection pool across several downloads.
 	"""
-	timeout = ClientTimeout(total=timeout_seconds)  # Set a total timeout of 10 minutes
-	async with aiohttp.ClientSession(timeout=timeout) as session:  # noqa: SIM117
-		try:
-			async with session.get(download_link) as response:
-				total = int(response.headers.get('content-length', 0))
-				task = progress.add_task(
-					f'[cyan]Downloading {file_path.name}...', total=total
-				)
-				with file_path.open('wb') as f:
-					async for chunk in response.content.iter_chunked(8192):
-						f.write(chunk)
-						progress.update(task, advance=len(chunk))
-		except asyncio.TimeoutError:
-			Console().print(
-				f'[bold red]Timeout while downloading {file_path.name}. Please try again later.[/]'
+	if session is None:
+		async with aiohttp.ClientSession() as own_session:
+			return await download_dataset(
+				download_link, file_path, progress, timeout_seconds, own_session
 			)
-			raise
+
+	timeout = ClientTimeout(total=timeout_seconds)
+	try:
+		async with session.get(download_link, timeout=timeout) as response:
+			total = int(response.headers.get('content-length', 0))
+			task = progress.add_task(
+				f'[cyan]Downloading {file_path.name}...', total=total
+			)
+			with file_path.open('wb') as f:
+				async for chunk in response.content.iter_chunked(8192):
+					f.write(chunk)
+					progress.update(task, advance=len(chunk))
+	except asyncio.TimeoutError:
+		get_console().print(
+			f'[bold red]Timeout while downloading {file_path.name}. Please try again later.[/]'
+		)
+		raise
 	return file_path
@@ -14,13 +14,12 @@ Author:
 
 from __future__ import annotations
 
+import functools
+import sys
 from abc import ABC
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Type, TypeVar
-
-from rich.console import Console
-from rich.table import Table
+from typing import Callable, List, Optional, Tuple, Type, TypeVar, cast
 
 from orcestradownloader.models.common import (
 	AbstractRecord,
@@ -33,9 +32,58 @@ from orcestradownloader.models.common import (
 
 # Type variable for subclasses of BaseModel
 T = TypeVar('T', bound='BaseModel')
+V = TypeVar('V')
+
+
+def _intern(value: V) -> V:
+	"""Intern a string from the JSON, passing null or non-string values through."""
+	return cast('V', sys.intern(value)) if isinstance(value, str) else value
+
+
+_GENOME_TYPES = {genome_type.value: genome_type for genome_type in GenomeType}
+
+
+# (header, column options) for the two columns of the summary table
+_SUMMARY_COLUMNS = (
+	('Field', {'style': 'bold cyan', 'no_wrap': True}),
+	('Value', {'style': 'magenta'}),
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso(date_str: str) -> datetime:
+	"""Parse an ISO 8601 timestamp, reusing results for repeated strings."""
+	# The API's timestamps end in a single 'Z', which fromisoformat rejects before
+	# Python 3.11; dropping it keeps the result naive, as it has always been.
+	if date_str[-1:] == 'Z':
+		date_str = date_str[:-1]
+	return datetime.fromisoformat(date_str)
+
+
+@functools.lru_cache(maxsize=4096)
+def _make_publication(citation: str, link: str) -> Publication:
+	"""Build a Publication, sharing one instance between datasets that cite it."""
+	return Publication(_intern(citation), _intern(link))
+
 
+@functools.lru_cache(maxsize=4096)
+def _make_dataset(
+	name: str, version: str, publications: Tuple[Tuple[str, str], ...]
+) -> Dataset:
+	"""Build a Dataset, sharing one instance between records that embed the same one.
 
-@dataclass
+	Dataset, VersionInfo and Publication are frozen, so sharing is safe; use
+	dataclasses.replace to derive a customized copy.
+	"""
+	version_info = VersionInfo(
+		version=_intern(version),
+		dataset_type=None,
+		publication=tuple(_make_publication(*pub) for pub in publications),
+	)
+	return Dataset(name=_intern(name), version_info=version_info)
+
+
+@dataclass(slots=True)
 class BaseModel(AbstractRecord, ABC):
 	"""
 	Abstract base class for dataset records.
@@ -57,6 +105,10 @@ class BaseModel(AbstractRecord, ABC):
 	    The dataset associated with the record.
 	available_datatypes : List[AvailableDatatype]
 	    A list of available datatypes for the dataset.
+	date_created_str : str
+	    The creation date formatted as YYYY-MM-DD, or 'N/A' if unknown.
+	datatypes : List[str]
+	    The names of the available datatypes.
 	"""
 
 	name: str
@@ -65,6 +117,13 @@ class BaseModel(AbstractRecord, ABC):
 	date_created: Optional[datetime]
 	dataset: Dataset
 	available_datatypes: List[AvailableDatatype] = field(default_factory=list)
+	date_created_str: str = field(default='N/A', init=False, repr=False, compare=False)
+	datatypes: List[str] = field(init=False, repr=False, compare=False)
+
+	def __post_init__(self) -> None:
+		self.datatypes = [datatype.name for datatype in self.available_datatypes]
+		if self.date_created:
+			self.date_created_str = self.date_created.strftime('%Y-%m-%d')
 
 	@classmethod
 	def from_json(cls: Type[T], data: dict) -> T:
@@ -81,18 +140,56 @@ class BaseModel(AbstractRecord, ABC):
 		T
 		    An instance of the implementing subclass.
 		"""
-		date_created = cls.parse_date(data.get('dateCreated'))
-		dataset = cls.parse_dataset(data['dataset'])
-		datatypes = cls.parse_datatypes(data.get('availableDatatypes', []))
-		return cls(
-			name=data['name'],
-			doi=data['doi'],
-			download_link=data['downloadLink'],
-			date_created=date_created,
-			dataset=dataset,
-			available_datatypes=datatypes,
+		return cls._record_builder()(data)
+
+	@classmethod
+	def from_json_many(cls: Type[T], items: List[dict]) -> List[T]:
+		"""
+		Create instances of the subclass from a list of JSON objects.
+
+		Equivalent to calling ``from_json`` on each item. Unless a subclass
+		overrides ``from_json``, the record builder is set up once for the
+		whole batch instead of once per record.
+
+		Parameters
+		----------
+		items : List[dict]
+		    The JSON objects containing data for the records.
+
+		Returns
+		-------
+		List[T]
+		    Instances of the implementing subclass, in the order of ``items``.
+		"""
+		if cls.from_json.__func__ is BaseModel.from_json.__func__:  # type: ignore[attr-defined]
+			build = cls._record_builder()
+		else:
+			build = cls.from_json
+		return list(map(build, items))
+
+	@classmethod
+	def _record_builder(cls: Type[T]) -> Callable[[dict], T]:
+		"""Return a function that builds one record from its JSON object."""
+		parse_date, parse_dataset, parse_datatypes, intern = (
+			cls.parse_date,
+			cls.parse_dataset,
+			cls.parse_datatypes,
+			_intern,
 		)
 
+		def build(data: dict) -> T:
+			# Positional arguments, in field order, bind faster than keywords
+			return cls(
+				intern(data['name']),
+				data['doi'],
+				data['downloadLink'],
+				parse_date(data.get('dateCreated')),
+				parse_dataset(data['dataset']),
+				parse_datatypes(data.get('availableDatatypes', [])),
+			)
+
+		return build
+
 	@staticmethod
 	def parse_date(date_str: Optional[str]) -> Optional[datetime]:
 		"""
@@ -108,7 +205,7 @@ class BaseModel(AbstractRecord, ABC):
 		Optional[datetime]
 		    A datetime object if parsing is successful, else None.
 		"""
-		return datetime.fromisoformat(date_str.rstrip('Z')) if date_str else None
+		return _parse_iso(date_str) if date_str else None
 
 	@staticmethod
 	def parse_dataset(dataset_data: dict) -> Dataset:
@@ -125,14 +222,13 @@ class BaseModel(AbstractRecord, ABC):
 		Dataset
 		    A Dataset instance.
 		"""
-		version_info = VersionInfo(
-			version=dataset_data['versionInfo']['version'],
-			dataset_type=None,  # Can be customized by subclasses
-			publication=[
-				Publication(**pub) for pub in dataset_data['versionInfo']['publication']
-			],
+		version_info = dataset_data['versionInfo']
+		publications = tuple(
+			(pub['citation'], pub['link']) for pub in version_info['publication']
+		)
+		return _make_dataset(
+			dataset_data['name'], version_info['version'], publications
 		)
-		return Dataset(name=dataset_data['name'], version_info=version_info)
 
 	@staticmethod
 	def parse_datatypes(datatypes: List[dict]) -> List[AvailableDatatype]:
@@ -149,68 +245,57 @@ class BaseModel(AbstractRecord, ABC):
 		List[AvailableDatatype]
 		    A list of AvailableDatatype instances.
 		"""
+		# Bind the callables once rather than looking them up for every datatype
+		make, intern, genome_types = AvailableDatatype, _intern, _GENOME_TYPES
 		return [
-			AvailableDatatype(
-				name=dt['name'],
-				genome_type=GenomeType(dt['genomeType'])
-				if 'genomeType' in dt
-				else None,
-				source=dt.get('source'),
+			make(
+				intern(dt['name']),
+				None
+				if (genome := dt.get('genomeType')) is None
+				else genome_types[genome],
+				intern(dt.get('source')),
 			)
 			for dt in datatypes
 		]
 
-	@property
-	def datatypes(self) -> List[str]:
-		"""
-		Get a list of available datatype names.
-
-		Returns
-		-------
-		List[str]
-		    A list of datatype names.
-		"""
-		return [datatype.name for datatype in self.available_datatypes]
-
 	def print_summary(self, title: str | None = None) -> None:
 		"""
 		Print a summary of the dataset record.
 
 		This method uses Rich to display a well-formatted table of the record's attributes.
 		"""
-		table = Table(title=title if title else f'{self.__class__.__name__} Summary')
+		version_info = self.dataset.version_info
+		datatypes = self.datatypes
+		rows = [
+			('Orcestra Dataset Name', self.name),
+			('DOI', self.doi),
+			(
+				'Date Created',
+				self.date_created.isoformat() if self.date_created else 'N/A',
+			),
+			('Download Link', self.download_link),
+			('Original Dataset Name', self.dataset.name),
+			('Dataset Version', version_info.version),
+			(
+				'Dataset Type',
+				version_info.dataset_type.name if version_info.dataset_type else 'N/A',
+			),
+			('Available Datatypes', ', '.join(datatypes) if datatypes else 'N/A'),
+			(
+				'Publications',
+				', '.join(
+					[f'{pub.citation} ({pub.link})' for pub in version_info.publication]
+				),
+			),
+		]
 
-		table.add_column('Field', style='bold cyan', no_wrap=True)
-		table.add_column('Value', style='magenta')
+		from rich import get_console  # noqa: PLC0415
+		from rich.table import Table  # noqa: PLC0415
 
-		table.add_row('Orcestra Dataset Name', self.name)
-		table.add_row('DOI', self.doi)
-		table.add_row(
-			'Date Created',
-			self.date_created.isoformat() if self.date_created else 'N/A',
-		)
-		table.add_row('Download Link', self.download_link)
-		table.add_row('Original Dataset Name', self.dataset.name)
-		table.add_row('Dataset Version', self.dataset.version_info.version)
-		table.add_row(
-			'Dataset Type',
-			self.dataset.version_info.dataset_type.name
-			if self.dataset.version_info.dataset_type
-			else 'N/A',
-		)
-		table.add_row(
-			'Available Datatypes',
-			', '.join(self.datatypes) if self.datatypes else 'N/A',
-		)
-		table.add_row(
-			'Publications',
-			', '.join(
-				[
-					f'{pub.citation} ({pub.link})'
-					for pub in self.dataset.version_info.publication
-				]
-			),
-		)
+		table = Table(title=title if title else f'{self.__class__.__name__} Summary')
+		for header, options in _SUMMARY_COLUMNS:
+			table.add_column(header, **options)
+		for row in rows:
+			table.add_row(*row)
 
-		console = Console()
-		console.print(table)
+		get_console().print(table)
@@ -12,32 +12,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from orcestradownloader.logging_config import logger as log
 from orcestradownloader.models.base import BaseModel
 
 
-@dataclass
+@dataclass(slots=True)
 class ClinicalGenomics(BaseModel):
 	"""
 	Represents a radiogenomic dataset.
 
 	Inherits from BaseModel for shared functionality.
 	"""
-
-	@classmethod
-	def from_json(cls, data: dict) -> ClinicalGenomics:
-		"""
-		Create a ClinicalGenomics instance from a JSON object.
-
-		Parameters
-		----------
-		data : dict
-		    The JSON object containing data for the record.
-
-		Returns
-		-------
-		ClinicalGenomics
-		    An instance of ClinicalGenomics.
-		"""
-		log.debug('Parsing ClinicalGenomics from JSON: %s', data)
-		return super().from_json(data)
@@ -24,17 +24,17 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional
+from typing import Optional, Tuple
 
 
-class GenomeType(Enum):
+class GenomeType(str, Enum):
 	"""Enum representing the type of genome data."""
 
 	DNA = 'DNA'
 	RNA = 'RNA'
 
 
-class TypeEnum(Enum):
+class TypeEnum(str, Enum):
 	"""Enum representing the type of dataset."""
 
 	BOTH = 'both'
@@ -42,7 +42,7 @@ class TypeEnum(Enum):
 	SENSITIVITY = 'sensitivity'
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Publication:
 	"""
 	Represents a publication related to a dataset.
@@ -59,7 +59,7 @@ class Publication:
 	link: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VersionInfo:
 	"""
 	Contains version and publication information for a dataset.
@@ -70,16 +70,16 @@ class VersionInfo:
 	    The version of the dataset.
 	dataset_type : Optional[TypeEnum]
 	    The type of dataset (e.g., sensitivity, perturbation, both).
-	publication : List[Publication]
-	    List of publications related to the dataset.
+	publication : Tuple[Publication, ...]
+	    Publications related to the dataset.
 	"""
 
 	version: str
 	dataset_type: Optional[TypeEnum]
-	publication: List[Publication]
+	publication: Tuple[Publication, ...]
 
 
-@dataclass
+@dataclass(slots=True)
 class AvailableDatatype:
 	"""
 	Represents a datatype available in a dataset.
@@ -99,7 +99,7 @@ class AvailableDatatype:
 	source: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Dataset:
 	"""
 	Represents a dataset with version information.
@@ -131,6 +131,8 @@ class AbstractRecord(ABC):
 	    Abstract method for printing a summary of the record.
 	"""
 
+	__slots__ = ()
+
 	@classmethod
 	@abstractmethod
 	def from_json(cls, data: dict) -> AbstractRecord:
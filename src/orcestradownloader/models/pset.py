@@ -15,11 +15,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from orcestradownloader.logging_config import logger as log
 from orcestradownloader.models.base import BaseModel
 
 
-@dataclass
+@dataclass(slots=True)
 class PharmacoSet(BaseModel):
 	"""
 	Represents a pharmacogenomic dataset.
@@ -43,39 +42,17 @@ class PharmacoSet(BaseModel):
 	    A list of available datatypes for the dataset.
 	"""
 
-	@classmethod
-	def from_json(cls, data: dict) -> PharmacoSet:
-		"""
-		Create a PharmacoSet instance from a JSON object.
-
-		Parameters
-		----------
-		data : dict
-		    The JSON object containing data for the record.
-
-		Returns
-		-------
-		PharmacoSet
-		    An instance of PharmacoSet.
-		"""
-		log.debug('Parsing PharmacoSet from JSON: %s', data)
-		return super().from_json(data)
-
 
 # Example usage
 if __name__ == '__main__':
-	import json
-	from pathlib import Path
-
-	# Path to the cache file
-	cache_file = Path.home() / '.cache/orcestradownloader/psets.json'
+	from orcestradownloader.cache import Cache
+	from orcestradownloader.dataset_config import CACHE_DIR
 
-	# Read the JSON data
-	with cache_file.open('r') as f:
-		data = json.load(f)
+	# Read the cached API response
+	data = Cache(CACHE_DIR, 'pharmacosets.json').get_cached_response('pharmacosets')
 
 	# Create a list of PharmacoSet instances
-	psets = [PharmacoSet.from_json(pset_data) for pset_data in data['data']]
+	psets = PharmacoSet.from_json_many(data or [])
 
 	# Print summaries of each PharmacoSet
 	for pset in psets:
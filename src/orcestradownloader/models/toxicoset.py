@@ -15,32 +15,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from orcestradownloader.logging_config import logger as log
 from orcestradownloader.models.base import BaseModel
 
 
-@dataclass
+@dataclass(slots=True)
 class ToxicoSet(BaseModel):
 	"""
 	Represents a toxicogenomic dataset.
 
 	Inherits from BaseModel for shared functionality.
 	"""
-
-	@classmethod
-	def from_json(cls, data: dict) -> ToxicoSet:
-		"""
-		Create a ToxicoSet instance from a JSON object.
-
-		Parameters
-		----------
-		data : dict
-		    The JSON object containing data for the record.
-
-		Returns
-		-------
-		ToxicoSet
-		    An instance of ToxicoSet.
-		"""
-		log.debug('Parsing ToxicoSet from JSON: %s', data)
-		return super().from_json(data)
@@ -0,0 +1,11 @@
+import logging
+
+import pytest
+
+@pytest.fixture(autouse=True)
+def orcestra_caplog(caplog):
+    """Fixture to let caplog see the 'orcestra' logger, which does not propagate."""
+    logger = logging.getLogger("orcestra")
+    logger.addHandler(caplog.handler)
+    yield caplog
+    logger.removeHandler(caplog.handler)
@@ -1,4 +1,6 @@
 import pytest
+import os
+import threading
 import json
 from datetime import datetime, timedelta
 from orcestradownloader.cache import Cache
@@ -87,4 +89,105 @@ def test_cache_file_logging(cache_instance, sample_data, caplog):
     assert response == sample_data, "Cached response does not match the expected data."
 
     assert any("Using cached response" in record.message for record in caplog.records), \
-        "Log message for valid cache not found."
\ No newline at end of file
+        "Log message for valid cache not found."
+
+def test_hydrated_cache_roundtrip(cache_instance, sample_data):
+    """Test that parsed records are returned for an unchanged cache file."""
+    cache_instance.cache_response("Test", sample_data)
+    records = [("Test", 42)]
+    cache_instance.put_hydrated(tuple, records)
+
+    assert cache_instance.get_hydrated(tuple, name="Test") == records, "Hydrated records were not returned."
+    assert cache_instance.get_hydrated(list, name="Test") is None, "Hydrated records should be keyed by type."
+
+def test_hydrated_cache_invalidated_on_rewrite(cache_instance, sample_data):
+    """Test that rewriting the cache file invalidates the parsed records."""
+    cache_instance.cache_response("Test", sample_data)
+    cache_instance.put_hydrated(tuple, [("Test", 42)])
+    cache_instance.cache_response("Test", sample_data + [{"name": "Other", "value": 1}])
+
+    assert cache_instance.get_hydrated(tuple, name="Test") is None, "Stale hydrated records should not be returned."
+
+def test_hydrated_cache_outdated(cache_instance, cache_file, sample_data):
+    """Test that parsed records built from an outdated cache are not returned."""
+    outdated_date = (datetime.now() - timedelta(days=8)).isoformat()
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    with cache_file.open("w") as f:
+        json.dump({"date": outdated_date, "data": sample_data}, f)
+
+    assert cache_instance.get_cached_response(name="Test") is None
+    cache_instance.put_hydrated(tuple, [("Test", 42)])
+    assert cache_instance.get_hydrated(tuple, name="Test") is None, "Outdated hydrated records should not be returned."
+
+def test_get_cached_response_picks_up_external_rewrite(cache_instance, cache_file, sample_data):
+    """Test that a cache file rewritten by another process is re-read."""
+    cache_instance.cache_response("Test", sample_data)
+    assert cache_instance.get_cached_response(name="Test") == sample_data
+
+    new_data = sample_data + [{"name": "Other", "value": 7}]
+    with cache_file.open("w") as f:
+        json.dump({"date": datetime.now().isoformat(), "data": new_data}, f)
+
+    response = cache_instance.get_cached_response(name="Test")
+    assert response == new_data, "Rewritten cache file was not re-read."
+
+def test_conditional_headers_from_validators(cache_instance, sample_data):
+    """Test that stored validators are sent back as conditional request headers."""
+    assert cache_instance.conditional_headers() == {}, "Missing cache should send no validators."
+    cache_instance.cache_response("Test", sample_data, etag='"abc"', last_modified="Wed, 01 Jan 2025 00:00:00 GMT")
+    headers = cache_instance.conditional_headers()
+    assert headers == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }, "Conditional headers do not match the stored validators."
+
+def test_refresh_outdated_cache(cache_instance, cache_file, sample_data):
+    """Test that refreshing an outdated cache makes it current again."""
+    outdated_date = (datetime.now() - timedelta(days=8)).isoformat()
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    with cache_file.open("w") as f:
+        json.dump({"date": outdated_date, "data": sample_data, "etag": '"abc"'}, f)
+
+    assert cache_instance.get_cached_response(name="Test") is None, "Outdated cache should return None."
+    assert cache_instance.conditional_headers() == {"If-None-Match": '"abc"'}
+    assert cache_instance.refresh("Test") == sample_data, "Refresh should return the cached data."
+    assert cache_instance.get_cached_response(name="Test") == sample_data, "Refreshed cache should be current."
+    assert cache_instance.conditional_headers() == {"If-None-Match": '"abc"'}, "Refresh should keep the validators."
+
+def test_get_cached_response_outdated_mtime(cache_instance, cache_file, sample_data):
+    """Test that a cache file with an old modification time is outdated without parsing it."""
+    cache_instance.cache_response("Test", sample_data)
+    old = (datetime.now() - timedelta(days=8)).timestamp()
+    os.utime(cache_file, (old, old))
+
+    response = cache_instance.get_cached_response(name="Test")
+    assert response is None, "Cache file with an old mtime should return None."
+
+def test_hydrated_cache_invalidated_on_version_change(cache_instance, sample_data, monkeypatch):
+    """Test that hydrated records written by another package version are ignored."""
+    cache_instance.cache_response("Test", sample_data)
+    cache_instance.put_hydrated(tuple, [("Test", 42)])
+    monkeypatch.setattr("orcestradownloader.cache.__version__", "0.0.0")
+    assert cache_instance.get_hydrated(tuple, name="Test") is None, "Hydrated records from another version should not be returned."
+
+def test_concurrent_cache_writes(cache_instance, cache_dir, sample_data):
+    """Test that concurrent writers do not interfere with each other's temporary files."""
+    cache_instance.cache_response("Test", sample_data)
+    errors = []
+
+    def write():
+        try:
+            for _ in range(50):
+                cache_instance.cache_response("Test", sample_data)
+        except Exception as e:  # noqa: BLE001
+            errors.append(e)
+
+    threads = [threading.Thread(target=write) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors, f"Concurrent writes failed: {errors[:3]}"
+    assert cache_instance.get_cached_response(name="Test") == sample_data
+    assert not list(cache_dir.glob("*.tmp")), "Temporary files were left behind."
@@ -0,0 +1,120 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import orcestradownloader.managers as managers
+from orcestradownloader.managers import DatasetManager, DatasetRegistry, UnifiedDataManager
+from orcestradownloader.models import PharmacoSet
+
+ETAG = '"v1"'
+
+RECORDS = [
+    {
+        "name": f"Test_{i}",
+        "doi": f"10.1/{i}",
+        "downloadLink": f"https://example.com/{i}.rds",
+        "dateCreated": "2024-01-02T03:04:05.000Z",
+        "dataset": {"name": "Test", "versionInfo": {"version": "1", "publication": []}},
+        "availableDatatypes": [],
+    }
+    for i in range(3)
+]
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Fixture to point dataset managers at a temporary cache directory."""
+    monkeypatch.setattr(managers, "CACHE_DIR", tmp_path / "cache")
+    return tmp_path / "cache"
+
+def run_against_api(coro_factory, always_not_modified=False):
+    """Run ``coro_factory(url)`` against a local API and return the request headers it saw."""
+    requests = []
+
+    async def handler(request):
+        requests.append(dict(request.headers))
+        if always_not_modified or request.headers.get("If-None-Match") == ETAG:
+            return web.Response(status=304, headers={"ETag": ETAG})
+        return web.json_response(RECORDS, headers={"ETag": ETAG})
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/api/psets/available", handler)
+        async with TestServer(app) as server:
+            await coro_factory(str(server.make_url("/api/psets/available")))
+
+    asyncio.run(main())
+    return requests
+
+def make_manager(url):
+    return DatasetManager(url=url, cache_file="psets.json", dataset_type=PharmacoSet)
+
+def test_fetch_data_downloads_and_caches():
+    """Test that a 200 response is parsed and cached along with its ETag."""
+    async def fetch(url):
+        manager = make_manager(url)
+        await manager.fetch_data("psets")
+        assert manager.names() == ["Test_0", "Test_1", "Test_2"]
+        assert manager.cache.conditional_headers() == {"If-None-Match": ETAG}
+
+    requests = run_against_api(fetch)
+    assert len(requests) == 1
+    assert "If-None-Match" not in requests[0], "Nothing cached yet, so nothing to revalidate."
+
+def test_fetch_data_revalidates_outdated_cache(monkeypatch):
+    """Test that an outdated cache is revalidated and reused on 304 Not Modified."""
+    async def fetch(url):
+        await make_manager(url).fetch_data("psets")
+        monkeypatch.setattr(managers, "CACHE_DAYS_TO_KEEP", -1)
+        manager = make_manager(url)
+        await manager.fetch_data("psets")
+        assert manager.names() == ["Test_0", "Test_1", "Test_2"], "Cached records should be reused on 304."
+
+    requests = run_against_api(fetch)
+    assert len(requests) == 2
+    assert requests[1].get("If-None-Match") == ETAG, "Outdated cache should be revalidated."
+
+def test_fetch_data_force_skips_revalidation():
+    """Test that a forced fetch always downloads the catalog again."""
+    async def fetch(url):
+        await make_manager(url).fetch_data("psets")
+        await make_manager(url).fetch_data("psets", force=True)
+
+    requests = run_against_api(fetch)
+    assert len(requests) == 2
+    assert "If-None-Match" not in requests[1], "Forced fetch should not send validators."
+
+def test_fetch_data_not_modified_fallback_retries_once(monkeypatch):
+    """Test that a 304 without a usable cache retries once, without validators."""
+    monkeypatch.setattr(managers, "CACHE_DAYS_TO_KEEP", -1)
+
+    async def fetch(url):
+        manager = make_manager(url)
+        manager.cache.cache_response("psets", RECORDS, etag=ETAG)
+        monkeypatch.setattr(manager.cache, "refresh", lambda name: None)
+        # The server answers 304 even to the unconditional retry, leaving no body to parse
+        with pytest.raises(ValueError):
+            await manager.fetch_data("psets")
+
+    requests = run_against_api(fetch, always_not_modified=True)
+    assert len(requests) == 2, "The fallback should retry exactly once."
+    assert requests[0].get("If-None-Match") == ETAG
+    assert "If-None-Match" not in requests[1], "The retry should not send validators."
+
+def test_fetch_all_checks_cache_once(caplog):
+    """Test that fetch_all checks each cache once and fetches the misses from the API."""
+    caplog.set_level("INFO", logger="orcestra")
+
+    async def fetch(url):
+        registry = DatasetRegistry()
+        for name in ("first", "second"):
+            registry.register(name, DatasetManager(url=url, cache_file=f"{name}.json", dataset_type=PharmacoSet))
+        await UnifiedDataManager(registry).fetch_all()
+        for manager in registry.get_all_managers().values():
+            assert manager.names() == ["Test_0", "Test_1", "Test_2"]
+
+    requests = run_against_api(fetch)
+    assert len(requests) == 2
+    misses = [record for record in caplog.records if record.getMessage() == "Cache file not found."]
+    assert len(misses) == 2, "Each cache miss should be logged once."
@@ -0,0 +1,77 @@
+import dataclasses
+
+import pytest
+
+from orcestradownloader.models import PharmacoSet
+from orcestradownloader.models.common import TypeEnum
+
+@pytest.fixture
+def record_data():
+    """Fixture to return a dataset record as returned by the API."""
+    return {
+        "name": "Test_2024",
+        "doi": "10.1/test",
+        "downloadLink": "https://example.com/test.rds",
+        "dateCreated": "2024-01-02T03:04:05.000Z",
+        "dataset": {
+            "name": "Test",
+            "versionInfo": {
+                "version": "2024",
+                "publication": [{"citation": "Someone et al.", "link": "https://example.com/paper"}],
+            },
+        },
+        "availableDatatypes": [
+            {"name": "rnaseq", "genomeType": "RNA", "source": "source"},
+            {"name": "mutation", "genomeType": "DNA"},
+        ],
+    }
+
+def test_shared_dataset_is_immutable(record_data):
+    """Test that records sharing a Dataset instance cannot change it for each other."""
+    first = PharmacoSet.from_json(record_data)
+    second = PharmacoSet.from_json({**record_data, "name": "Other_2024"})
+    assert first.dataset is second.dataset, "Identical datasets should be shared."
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.dataset.version_info.dataset_type = TypeEnum.BOTH
+    customized = dataclasses.replace(first.dataset.version_info, dataset_type=TypeEnum.BOTH)
+    assert customized.dataset_type is TypeEnum.BOTH
+    assert second.dataset.version_info.dataset_type is None, "Customizing a copy should not affect other records."
+
+def test_from_json_many_matches_from_json(record_data):
+    """Test that batch parsing builds the same records as from_json."""
+    items = [record_data, {**record_data, "name": "Other_2024", "dateCreated": None}]
+    assert PharmacoSet.from_json_many(items) == [PharmacoSet.from_json(item) for item in items]
+
+def test_from_json_many_uses_overridden_from_json(record_data):
+    """Test that batch parsing goes through a subclass's own from_json."""
+    @dataclasses.dataclass(slots=True)
+    class Renamed(PharmacoSet):
+        @classmethod
+        def from_json(cls, data):
+            return super(Renamed, cls).from_json({**data, "name": data["name"].upper()})
+
+    assert [record.name for record in Renamed.from_json_many([record_data])] == ["TEST_2024"]
+
+def test_from_json_accepts_null_version(record_data):
+    """Test that a dataset without a version string does not break parsing."""
+    record_data["dataset"]["versionInfo"]["version"] = None
+    record = PharmacoSet.from_json(record_data)
+    assert record.dataset.version_info.version is None
+
+
+def test_from_json_accepts_null_publication_link(record_data):
+    """Test that a publication without a link does not break parsing."""
+    record_data["dataset"]["versionInfo"]["publication"][0]["link"] = None
+    record = PharmacoSet.from_json(record_data)
+    assert record.dataset.version_info.publication[0].link is None
+
+
+def test_from_json_accepts_null_names(record_data):
+    """Test that missing record, dataset and datatype names do not break parsing."""
+    record_data["name"] = None
+    record_data["dataset"]["name"] = None
+    record_data["availableDatatypes"][0]["name"] = None
+    record = PharmacoSet.from_json(record_data)
+    assert record.name is None
+    assert record.dataset.name is None
+    assert record.available_datatypes[0].name is None